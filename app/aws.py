@@ -1,19 +1,44 @@
 import boto3
+from botocore.config import Config
 import os
+import operator
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 import glueops.setup_logging
 
+MARKDOWN_NOTICE = "> This page is automatically generated. Any manual changes will be lost. See: https://github.com/GlueOps/getoutline-docs-update-aws-organizations \n\n"
+ACCOUNTS_TABLE_HEADER = (
+    '| AWS Account ID | Account Name | Description | Account Email | Created Date |\n'
+    '|----------------|--------------|-------------|---------------|--------------|\n'
+)
+IAM_USERS_TABLE_HEADER = (
+    '\n\n| IAM User Name | Access Key ID | Description |\n'
+    '|---------------|---------------|-------------|\n'
+)
+
+def _is_active(account):
+    # Prefer the newer State field and fall back to the deprecated Status field
+    return account.get('State', account.get('Status')) == 'ACTIVE'
+
 class AWSOrganization:
     def __init__(self, aws_account_name, aws_access_key_id, aws_secret_access_key, log_level="INFO"):
         self.aws_account_name = aws_account_name
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
+        self._session = boto3.session.Session(
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key
+        )
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+        self._boto_config = Config(max_pool_connections=50, retries={'max_attempts': 10, 'mode': 'adaptive'})
         self.logger = glueops.setup_logging.configure(level=log_level)
         self.logger.info(f"Logger initialized with level: {log_level}")
 
     def get_aws_client(self, service_name):
         """
-        Creates a boto3 client for the specified AWS service.
+        Returns a boto3 client for the specified AWS service, creating it on first use.
 
         Args:
             service_name (str): The name of the AWS service.
@@ -21,11 +46,10 @@ class AWSOrganization:
         Returns:
             boto3.client: The AWS service client.
         """
-        return boto3.client(
-            service_name, 
-            aws_access_key_id=self.aws_access_key_id, 
-            aws_secret_access_key=self.aws_secret_access_key
-        )
+        with self._clients_lock:
+            if service_name not in self._clients:
+                self._clients[service_name] = self._session.client(service_name, config=self._boto_config)
+            return self._clients[service_name]
 
     def get_aws_accounts(self, org_client):
         """
@@ -40,7 +64,7 @@ class AWSOrganization:
         try:
             paginator = org_client.get_paginator('list_accounts')
             accounts = []
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig={'PageSize': 20}):
                 accounts.extend(page['Accounts'])
             self.logger.info(f"Retrieved {len(accounts)} accounts.")
             return accounts
@@ -61,11 +85,7 @@ class AWSOrganization:
         """
         try:
             response = org_client.list_tags_for_resource(ResourceId=account_id)
-            tags = response['Tags']
-            for tag in tags:
-                if tag['Key'] == 'Description':
-                    return tag['Value']
-            return 'No Description'
+            return next((t['Value'] for t in response['Tags'] if t['Key'] == 'Description'), 'No Description')
         except Exception as e:
             self.logger.error(f"Failed to retrieve tags for account {account_id}: {e}")
             raise
@@ -81,7 +101,7 @@ class AWSOrganization:
             iam_client = self.get_aws_client('iam')
             paginator = iam_client.get_paginator('list_users')
             users = []
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig={'PageSize': 1000}):
                 users.extend(page['Users'])
             self.logger.info(f"Retrieved {len(users)} IAM users.")
             return users
@@ -107,54 +127,112 @@ class AWSOrganization:
             self.logger.error(f"Failed to retrieve access keys for user {user_name}: {e}")
             raise
 
-    def create_markdown(self, accounts, org_client):
+    def _fetch_user_detail(self, user_name):
+        """
+        Retrieves the access keys and tags for a given IAM user.
+
+        Args:
+            user_name (str): The IAM user name.
+
+        Returns:
+            tuple: The user name, a list of access key metadata and a dict of user tags.
+        """
+        try:
+            access_keys = self.get_user_access_keys(user_name)
+            # Tags are only rendered alongside access keys, so skip the lookup otherwise
+            if not access_keys:
+                return user_name, access_keys, {}
+            iam_client = self.get_aws_client('iam')
+            tags = iam_client.list_user_tags(UserName=user_name)['Tags']
+            tags_dict = {tag['Key']: tag['Value'] for tag in tags}
+            return user_name, access_keys, tags_dict
+        except Exception as e:
+            self.logger.error(f"Failed to retrieve details for user {user_name}: {e}")
+            raise
+
+    def fetch_account_tags(self, org_client, accounts):
+        """
+        Retrieves the Description tag for every active AWS account concurrently.
+
+        Args:
+            org_client (boto3.client): The AWS Organizations client.
+            accounts (list): A list of AWS accounts.
+
+        Returns:
+            dict: A mapping of account ID to description.
+        """
+        try:
+            account_ids = [account['Id'] for account in accounts if _is_active(account)]
+            tag_map = {}
+            with ThreadPoolExecutor(max_workers=max(1, min(16, len(account_ids)))) as executor:
+                futures = {
+                    executor.submit(self.get_account_tags, org_client, account_id): account_id
+                    for account_id in account_ids
+                }
+                for future in as_completed(futures):
+                    tag_map[futures[future]] = future.result()
+            return tag_map
+        except Exception as e:
+            self.logger.error(f"Failed to retrieve account tags: {e}")
+            raise
+
+    def fetch_users_details(self):
+        """
+        Retrieves the access keys and tags for every IAM user concurrently.
+
+        Returns:
+            list: (user name, access keys, tags dict) tuples in the order returned by IAM.
+        """
+        try:
+            user_names = [user['UserName'] for user in self.list_iam_users()]
+            with ThreadPoolExecutor(max_workers=max(1, min(16, len(user_names)))) as executor:
+                return list(executor.map(self._fetch_user_detail, user_names))
+        except Exception as e:
+            self.logger.error(f"Failed to retrieve IAM user details: {e}")
+            raise
+
+    def create_markdown(self, accounts, accounts_tag_map, users_details):
         """
         Creates a markdown table with details about the AWS accounts and IAM users.
 
         Args:
             accounts (list): A list of AWS accounts.
-            org_client (boto3.client): The AWS Organizations client.
+            accounts_tag_map (dict): A mapping of account ID to description, see fetch_account_tags.
+            users_details (list): IAM user details, see fetch_users_details.
 
         Returns:
             str: The markdown content.
         """
         try:
             # Sort accounts by created date (JoinedTimestamp)
-            accounts = sorted(accounts, key=lambda x: x['JoinedTimestamp'])
-            markdown_content = "> This page is automatically generated. Any manual changes will be lost. See: https://github.com/GlueOps/getoutline-docs-update-aws-organizations \n\n"
-            markdown_content += f"# AWS ROOT Organization Details for {self.aws_account_name}\n\n"
-            markdown_content += '| AWS Account ID | Account Name | Description | Account Email | Created Date |\n'
-            markdown_content += '|----------------|--------------|-------------|---------------|--------------|\n'
-            
+            accounts.sort(key=operator.itemgetter('JoinedTimestamp'))
+
+            parts = []
+            parts.append(MARKDOWN_NOTICE)
+            parts.append(f"# AWS ROOT Organization Details for {self.aws_account_name}\n\n")
+            parts.append(ACCOUNTS_TABLE_HEADER)
+
             for account in accounts:
                 account_id = account['Id']
                 account_name = account['Name']
                 account_email = account['Email']
                 created_date = account['JoinedTimestamp'].strftime('%Y-%m-%d')
-                description = self.get_account_tags(org_client, account_id)
-                markdown_content += f'| {account_id} | {account_name} | {description} | {account_email} | {created_date} |\n'
-
-            markdown_content += '\n\n| IAM User Name | Access Key ID | Description |\n'
-            markdown_content += '|---------------|---------------|-------------|\n'
-            users = self.list_iam_users()
-            for user in users:
-                user_name = user['UserName']
-                access_keys = self.get_user_access_keys(user_name)
+                # Tags are only fetched for active accounts
+                description = accounts_tag_map.get(account_id, 'No Description')
+                parts.append(f'| {account_id} | {account_name} | {description} | {account_email} | {created_date} |\n')
+
+            parts.append(IAM_USERS_TABLE_HEADER)
+            for user_name, access_keys, tags_dict in users_details:
                 if not access_keys:
-                    markdown_content += f'| {user_name} | No Access Key | No Description |\n'
+                    parts.append(f'| {user_name} | No Access Key | No Description |\n')
                 else:
+                    description = tags_dict.get('description', 'No Description')
                     for access_key in access_keys:
                         access_key_id = access_key['AccessKeyId']
-                        description = 'No Description'
-                        tags = self.get_aws_client('iam').list_user_tags(UserName=user_name)['Tags']
-                        for tag in tags:
-                            if tag['Key'] == 'description':
-                                description = tag['Value']
-                        markdown_content += f'| {user_name} | {access_key_id} | {description} |\n'
+                        parts.append(f'| {user_name} | {access_key_id} | {description} |\n')
 
             self.logger.info("Markdown content created successfully.")
-            return markdown_content
+            return "".join(parts)
         except Exception as e:
             self.logger.error(f"Failed to create markdown content: {e}")
             raise
-
@@ -2,6 +2,7 @@ import boto3
 import os
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
 import glueops.setup_logging
 import glueops.getoutline
 from aws import AWSOrganization
@@ -51,70 +52,80 @@ def get_env_variable(var_name: str, default=None):
     if var_name in REQUIRED_ENV_VARS and value is None:
         logger.error(f"Environment variable '{var_name}' is not set.")
         raise EnvironmentError(f"Environment variable '{var_name}' is required but not set.")
-    logger.debug(f"Environment variable '{var_name}' retrieved.")
+    logger.debug("Environment variable '%s' retrieved.", var_name)
     return value
 
 # Configure logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 logger = glueops.setup_logging.configure(level=LOG_LEVEL)
 logger.info(f"Logger initialized with level: {LOG_LEVEL}")
-logger.info({
-    "version": os.getenv("VERSION", "unknown"),
-    "commit_sha": os.getenv("COMMIT_SHA", "unknown"),
-    "build_timestamp": os.getenv("BUILD_TIMESTAMP", "unknown")
-})
+BUILD_INFO = {name.lower(): os.getenv(name, default) for name, default in OPTIONAL_ENV_VARS.items()}
+logger.info(BUILD_INFO)
 
 try:
     GETOUTLINE_DOCUMENT_ID = get_env_variable('GETOUTLINE_DOCUMENT_ID')
     GETOUTLINE_API_TOKEN = get_env_variable('GETOUTLINE_API_TOKEN')
     AWS_CREDENTIALS_JSON = get_env_variable('AWS_CREDENTIALS_JSON')
-    get_credentials()
-    VERSION = get_env_variable('VERSION', OPTIONAL_ENV_VARS['VERSION'])
-    COMMIT_SHA = get_env_variable('COMMIT_SHA', OPTIONAL_ENV_VARS['COMMIT_SHA'])
-    BUILD_TIMESTAMP = get_env_variable('BUILD_TIMESTAMP', OPTIONAL_ENV_VARS['BUILD_TIMESTAMP'])
     logger.info("All required environment variables retrieved successfully.")
 except EnvironmentError as env_err:
     logger.critical(f"Environment setup failed: {env_err}")
     raise
 
+def _process_account(creds):
+    """
+    Generate the markdown for a single AWS organization.
+
+    :param creds: Dictionary with the name, access_key and secret_key of the AWS account.
+    :return: Markdown content for the AWS organization.
+    """
+    aws_account_name = creds['name']
+    access_key = creds['access_key']
+    secret_key = creds['secret_key']
+
+    aws_org = AWSOrganization(aws_account_name, access_key, secret_key)
+    org_client = aws_org.get_aws_client('organizations')
+    accounts = aws_org.get_aws_accounts(org_client)
+
+    # Organizations and IAM lookups are independent, so fetch the IAM details in
+    # the background while the account tags are fetched on this thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        users_future = executor.submit(aws_org.fetch_users_details)
+        accounts_tag_map = aws_org.fetch_account_tags(org_client, accounts)
+        users_details = users_future.result()
+
+    markdown_content = aws_org.create_markdown(accounts, accounts_tag_map, users_details)
+    logger.debug("Markdown content: %s", markdown_content)
+    logger.info(f"Generated Markdown for AWS ORG: {aws_account_name}")
+    return markdown_content
+
 def main():
     """
     Main function to execute the script.
     """
     try:
         logger.info("Starting script execution.")
+        # Retrieve AWS account credentials before touching any Outline documents
+        accounts_creds = get_credentials()
+
         # Initialize GetOutlineClient
         GetOutlineClient = glueops.getoutline.GetOutlineClient(GETOUTLINE_API_URL, GETOUTLINE_DOCUMENT_ID, GETOUTLINE_API_TOKEN)
         parent_id = GetOutlineClient.get_document_uuid()
         children = GetOutlineClient.get_children_documents_to_delete(parent_id)
         
-        # Delete existing child documents
-        for id in children:
-            GetOutlineClient.delete_document(id)
+        # Delete existing child documents concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(GetOutlineClient.delete_document, children))
+
+        # Generate the markdown for each AWS account concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(accounts_creds)))) as executor:
+            futures = [executor.submit(_process_account, creds) for creds in accounts_creds]
+
+            # Create new documents in Outline in credentials order so the sidebar order is stable
+            for creds, future in zip(accounts_creds, futures):
+                aws_account_name = creds['name']
+                GetOutlineClient.create_document(parent_id, aws_account_name, future.result())
+                logger.info(f"Created {aws_account_name} doc successfully under parent doc: {GETOUTLINE_DOCUMENT_ID}")
 
-        # Retrieve AWS account credentials
-        accounts_creds = get_credentials()
-        all_accounts = []
-        markdown_content = ""
-        
-        # Process each AWS account
-        for creds in accounts_creds:
-            aws_account_name = creds['name']
-            access_key = creds['access_key']
-            secret_key = creds['secret_key']
-            
-            aws_org = AWSOrganization(aws_account_name, access_key, secret_key)
-            org_client = aws_org.get_aws_client('organizations')
-            accounts = aws_org.get_aws_accounts(org_client)
-            all_accounts.extend(accounts)
-            markdown_content = aws_org.create_markdown(accounts, org_client)
-            logger.debug(f"Markdown content: {markdown_content}")
-            logger.info(f"Generated Markdown for AWS ORG: {aws_account_name}")
-        
-            # Create new document in Outline
-            GetOutlineClient.create_document(parent_id, aws_account_name, markdown_content)
-            logger.info(f"Created {aws_account_name} doc successfully under parent doc: {GETOUTLINE_DOCUMENT_ID}")
-            
         logger.info("Script execution completed successfully.")
     except Exception as e:
         logger.error(f"Script execution failed: {e}")